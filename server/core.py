@@ -21,6 +21,7 @@ from server.models.base import (
     JobStatus,
 )
 from server.settings_tenant import get_tenant_setting
+from server.utils.job_logging import add_job_log
 from server.utils.telemetry import capture_ai_span, capture_ai_trace
 
 # Set up logging
@@ -85,15 +86,19 @@ class APIGatewayCore:
         api_response_callback: Optional[ApiResponseCallback] = None,
         output_callback: Optional[Callable[[Any], None]] = None,
         session_id: str = None,
+        job_data: Optional[dict] = None,
     ) -> APIResponse:
-        """Execute an API by name with the given parameters."""
+        """Execute an API by name with the given parameters.
+
+        ``job_data`` may carry the already-loaded job row (e.g. from the claim
+        query); otherwise the job is fetched from the database.
+        """
         # Load API definitions fresh from the database
         api_definitions = await self.load_api_definitions()
         # Make sure job_id is still the correct ID string
 
-        job_data = self.db_tenant.get_job(
-            job_id
-        )  # Renamed from job, assuming this might return a dict
+        if job_data is None:
+            job_data = self.db_tenant.get_job(job_id)
 
         # Check if job_data is None or empty (if get_job can return None)
         if not job_data:
@@ -120,8 +125,6 @@ class APIGatewayCore:
         messages = []
 
         if message_count == 0:
-            from server.routes.jobs import add_job_log
-
             add_job_log(
                 job_id,
                 'system',
@@ -142,7 +145,7 @@ class APIGatewayCore:
             )
 
             # Record the API version used for this job if available
-            version_id = api_def.version_id if hasattr(api_def, 'version_id') else None
+            version_id = getattr(api_def, 'version_id', None)
             if version_id:
                 self.db_tenant.update_job(
                     job_id, {'api_definition_version_id': version_id}
@@ -275,13 +278,14 @@ class APIGatewayCore:
             logger.error(f'Job {job_id}: {error_message}', exc_info=True)
             # Update job status to ERROR on exception
             try:
+                now = datetime.now()
                 self.db_tenant.update_job(
                     job_id,
                     {
                         'status': JobStatus.ERROR.value,
                         'error': error_message,
-                        'completed_at': datetime.now(),
-                        'updated_at': datetime.now(),
+                        'completed_at': now,
+                        'updated_at': now,
                     },
                 )
             except Exception as db_err:
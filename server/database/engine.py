@@ -5,15 +5,38 @@ All database access should reuse this shared engine to avoid creating
 multiple connection pools.
 """
 
+import logging
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from server.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# Connections the job machinery can hold at once: each in-flight job has at
+# most two (its execution session and its lease heartbeat; its final write and
+# telemetry read run on fresh sessions only after the execution session is
+# closed), plus one for the background job-log writer. API requests and
+# maintenance tasks draw on DATABASE_MAX_OVERFLOW beyond that.
+min_pool_size = 2 * settings.JOB_WORKERS + 1
+
+pool_size = settings.DATABASE_POOL_SIZE
+if pool_size < min_pool_size:
+    logger.warning(
+        'DATABASE_POOL_SIZE=%d is below the %d connections %d job worker(s) can '
+        'hold; using a pool size of %d',
+        pool_size,
+        min_pool_size,
+        settings.JOB_WORKERS,
+        min_pool_size,
+    )
+    pool_size = min_pool_size
+
 # Create a single shared engine using application settings
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_size=settings.DATABASE_POOL_SIZE,
+    pool_size=pool_size,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_timeout=settings.DATABASE_POOL_TIMEOUT,
     pool_recycle=settings.DATABASE_POOL_RECYCLE,
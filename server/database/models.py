@@ -191,9 +191,9 @@ class JobLog(Base):
     timestamp = Column(DateTime, default=datetime.now)
     log_type = Column(String)  # system, http_exchange, tool_use, message, result, error
     content = Column(JSONB)
-    content_trimmed = Column(
-        JSONB, nullable=True
-    )  # Trimmed content without images for lighter processing
+    # Trimmed content without images for lighter processing; NULL (not JSON
+    # null) when nothing was trimmed, in which case readers use content
+    content_trimmed = Column(JSONB(none_as_null=True), nullable=True)
 
     job = relationship('Job', back_populates='logs')
 
@@ -3,6 +3,7 @@ Multi-tenancy utilities using SQLAlchemy schema translation.
 """
 
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional
 
 import sqlalchemy as sa
@@ -33,19 +34,29 @@ def get_tenant_specific_metadata():
     return meta
 
 
-@contextmanager
-def with_db(tenant_schema: Optional[str]):
-    """Context manager that returns a database session with tenant mapping."""
+@lru_cache(maxsize=1024)
+def _get_tenant_connectable(tenant_schema: Optional[str]):
+    """Return the shared engine with the tenant schema translation applied.
 
+    The option engine shares the underlying pool and is immutable, so it is
+    built once per schema instead of on every session.
+    """
     if tenant_schema:
         schema_translate_map = dict(tenant=tenant_schema)
     else:
         schema_translate_map = None
 
-    connectable = db_session.engine.execution_options(
+    return db_session.engine.execution_options(
         schema_translate_map=schema_translate_map
     )
 
+
+@contextmanager
+def with_db(tenant_schema: Optional[str]):
+    """Context manager that returns a database session with tenant mapping."""
+
+    connectable = _get_tenant_connectable(tenant_schema or None)
+
     with Session(autocommit=False, autoflush=False, bind=connectable) as db:
         yield db
 
@@ -22,6 +22,18 @@ from .models import (
     Tenant,
 )
 
+# Per-target advisory lock taken while claiming a job. Built once; the key is
+# '<tenant_schema>:<target_id>' so targets in different tenants never contend.
+_TRY_TARGET_CLAIM_LOCK = text(
+    'SELECT pg_try_advisory_xact_lock(hashtextextended(:key, 42))'
+)
+
+# Logs whose content had nothing to trim are stored without a separate trimmed
+# copy; fall back to the full content for those rows.
+_TRIMMED_LOG_CONTENT = func.coalesce(JobLog.content_trimmed, JobLog.content).label(
+    'content_trimmed'
+)
+
 
 class DatabaseService:
     def __init__(self):
@@ -126,18 +138,14 @@ class DatabaseService:
 
     def get_blocking_jobs_for_target(self, target_id, limit: int = 10, offset: int = 0):
         """Get jobs that are blocking the execution queue for a target (jobs in ERROR or PAUSED state).
-        Uses is_target_queue_paused as source of truth.
+        Uses the same blocking states as is_target_queue_paused, paginated in SQL.
         """
-        # Get blocking information from the source of truth
-        blocking_info = self.is_target_queue_paused(target_id)
-
-        # Return the blocking jobs with optional limit and offset
-        blocking_jobs = blocking_info['blocking_jobs']
-
-        # Apply limit and offset if needed
-        if offset > 0 or limit < len(blocking_jobs):
-            return blocking_jobs[offset : offset + limit]
-        return blocking_jobs
+        return self.list_jobs_by_status_and_target(
+            target_id,
+            [JobStatus.ERROR.value, JobStatus.PAUSED.value],
+            limit=limit,
+            offset=offset,
+        )
 
     # Session methods
     def create_session(self, session_data):
@@ -214,6 +222,7 @@ class DatabaseService:
         lease_owner: str,
         lease_seconds: int = 60,
         tenant_schema: str | None = None,
+        expire_stale: bool = False,
     ):
         """Atomically claim the next runnable job for execution.
 
@@ -222,6 +231,10 @@ class DatabaseService:
         guarantee only one claim per target across workers. Sets status to RUNNING
         and assigns a short lease to the claiming worker.
 
+        With ``expire_stale`` the stale-lease sweep of
+        ``expire_stale_running_jobs`` runs first in the same transaction, so a
+        worker tick needs a single round of BEGIN/COMMIT.
+
         Returns a job dict or None if nothing claimable.
         """
         with self.Session() as session:
@@ -230,6 +243,9 @@ class DatabaseService:
 
             trans = session.begin()
             try:
+                if expire_stale:
+                    self._expire_stale_running_jobs(session, now)
+
                 JobAlias = sa.orm.aliased(Job)
                 JobBlock = sa.orm.aliased(Job)
 
@@ -263,14 +279,13 @@ class DatabaseService:
                 target_id = str(candidate.target_id)
                 # Per-tenant advisory lock on target
                 locked = session.execute(
-                    text(
-                        'SELECT pg_try_advisory_xact_lock(hashtextextended(:key, 42))'
-                    ),
-                    {'key': (tenant_schema or '') + ':' + target_id},
+                    _TRY_TARGET_CLAIM_LOCK,
+                    {'key': f'{tenant_schema or ""}:{target_id}'},
                 ).scalar()
 
                 if not locked:
-                    trans.rollback()
+                    # Nothing was claimed; commit so a stale-lease sweep sticks
+                    trans.commit()
                     return None
 
                 # Transition to RUNNING with lease, clear any stale cancel requests
@@ -293,24 +308,7 @@ class DatabaseService:
         Returns a list of affected job dicts.
         """
         with self.Session() as session:
-            now = datetime.utcnow()
-            stale_jobs = (
-                session.query(Job)
-                .filter(
-                    Job.status == 'RUNNING',
-                    or_(Job.lease_expires_at.is_(None), Job.lease_expires_at < now),
-                )
-                .all()
-            )
-            affected = []
-            for job in stale_jobs:
-                job.status = 'ERROR'
-                job.error = 'Lease expired; worker likely terminated'
-                job.completed_at = now
-                job.updated_at = now
-                job.lease_owner = None
-                job.lease_expires_at = None
-                affected.append(self._to_dict(job))
+            affected = self._expire_stale_running_jobs(session, datetime.utcnow())
             # Always finalize the transaction to avoid leaving an open txn when
             # this method is used alongside other operations on the same Session
             # (e.g., claim_next_job starts its own explicit transaction).
@@ -318,6 +316,27 @@ class DatabaseService:
             session.commit()
             return affected
 
+    def _expire_stale_running_jobs(self, session, now: datetime) -> list[dict]:
+        # Single UPDATE ... RETURNING instead of loading and flushing each row
+        stale_jobs = session.scalars(
+            sa.update(Job)
+            .where(
+                Job.status == 'RUNNING',
+                or_(Job.lease_expires_at.is_(None), Job.lease_expires_at < now),
+            )
+            .values(
+                status='ERROR',
+                error='Lease expired; worker likely terminated',
+                completed_at=now,
+                updated_at=now,
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+            .returning(Job)
+            .execution_options(synchronize_session=False)
+        ).all()
+        return [self._to_dict(job) for job in stale_jobs]
+
     def renew_job_lease(
         self, job_id: UUID, lease_owner: str, lease_seconds: int = 60
     ) -> bool:
@@ -341,6 +360,36 @@ class DatabaseService:
             session.commit()
             return True
 
+    def renew_job_lease_and_check_cancel(
+        self, job_id: UUID, lease_owner: str, lease_seconds: int = 60
+    ) -> bool:
+        """Extend the lease of a RUNNING job and report a pending cancel request.
+
+        Both happen in one UPDATE ... RETURNING; if this worker no longer owns
+        the lease, only the cancel flag is read.
+        """
+        with self.Session() as session:
+            now = datetime.utcnow()
+            row = session.execute(
+                sa.update(Job)
+                .where(
+                    Job.id == job_id,
+                    Job.status == 'RUNNING',
+                    Job.lease_owner == lease_owner,
+                )
+                .values(
+                    lease_expires_at=now + timedelta(seconds=lease_seconds),
+                    updated_at=now,
+                )
+                .returning(Job.cancel_requested)
+                .execution_options(synchronize_session=False)
+            ).first()
+            session.commit()
+
+        if row is None:
+            return self.is_job_cancel_requested(job_id)
+        return bool(row.cancel_requested)
+
     def get_job(self, job_id):
         with self.Session() as session:
             job = session.query(Job).filter(Job.id == job_id).first()
@@ -396,7 +445,7 @@ class DatabaseService:
                     JobLog.job_id,
                     JobLog.timestamp,
                     JobLog.log_type,
-                    JobLog.content_trimmed,
+                    _TRIMMED_LOG_CONTENT,
                 ]
                 logs = (
                     session.query(*columns)
@@ -597,6 +646,14 @@ class DatabaseService:
             session.commit()
             return self._to_dict(log)
 
+    def create_job_logs(self, logs_data: List[dict]) -> None:
+        """Insert several job logs in a single executemany round-trip."""
+        if not logs_data:
+            return
+        with self.Session() as session:
+            session.execute(sa.insert(JobLog), logs_data)
+            session.commit()
+
     def list_job_logs(self, job_id, exclude_http_exchanges=True):
         with self.Session() as session:
             query = session.query(JobLog).filter(JobLog.job_id == job_id)
@@ -626,7 +683,7 @@ class DatabaseService:
                     JobLog.job_id,
                     JobLog.timestamp,
                     JobLog.log_type,
-                    JobLog.content_trimmed,
+                    _TRIMMED_LOG_CONTENT,
                 ]
                 logs = (
                     session.query(*columns)
@@ -30,11 +30,8 @@ from server.core import APIGatewayCore
 from server.models.base import Job, JobCreate, JobStatus, JobTerminalStates
 from server.settings import settings
 from server.utils.db_dependencies import get_tenant_db
-from server.utils.job_execution import (
-    add_job_log,
-    create_and_enqueue_job,
-    enqueue_job,
-)
+from server.utils.job_execution import create_and_enqueue_job, enqueue_job
+from server.utils.job_logging import add_job_log
 from server.utils.job_utils import compute_job_metrics
 from server.utils.telemetry import (
     capture_job_canceled,
@@ -144,11 +141,10 @@ async def list_target_jobs(
         http_exchanges = job_dict.get('http_exchanges', [])
         metrics = compute_job_metrics(job_dict, http_exchanges)
 
-        # Avoid passing helper field to the model
-        job_model = Job(**{k: v for k, v in job_dict.items() if k != 'http_exchanges'})
-        job_model_dict = job_model.model_dump()
-        job_model_dict.update(metrics)
-        enriched_jobs.append(Job(**job_model_dict))
+        # Avoid passing helper field to the model; validate the merged dict once
+        job_fields = {k: v for k, v in job_dict.items() if k != 'http_exchanges'}
+        job_fields.update(metrics)
+        enriched_jobs.append(Job(**job_fields))
 
     return enriched_jobs
 
@@ -514,24 +510,26 @@ async def resolve_job(
         )
 
     # Update the job with success status and the provided result
+    now = datetime.now()
     updated_job = db_tenant.update_job(
         job_id,
         {
             'status': JobStatus.SUCCESS,
             'result': result,
-            'completed_at': datetime.now()
+            'completed_at': now
             if job_model.completed_at is None
             else job_model.completed_at,
-            'updated_at': datetime.now(),
+            'updated_at': now,
         },
     )
 
     # Add log for resolving the job
     add_job_log(job_id_str, 'system', 'Job manually resolved', tenant['schema'])
 
-    # Check if there are any other jobs in error/paused state for this target
+    # Check if there are any other jobs in error/paused state for this target;
+    # only emptiness matters, so a single row is enough
     other_paused_jobs = db_tenant.list_jobs_by_status_and_target(
-        target_id, [JobStatus.PAUSED.value, JobStatus.ERROR.value]
+        target_id, [JobStatus.PAUSED.value, JobStatus.ERROR.value], limit=1
     )
 
     # If there are no other paused/error jobs, the queue can resume automatically
@@ -27,11 +27,12 @@ from server.routes import (
 from server.routes.sessions import session_router, websocket_router
 from server.routes.settings import settings_router
 from server.routes.tenants import tenants_router
-from server.settings_tenant import get_tenant_setting
+from server.settings_tenant import get_tenant_api_key, get_tenant_setting
 from server.utils.api_prefix import api_prefix
-from server.utils.auth import get_api_key
+from server.utils.auth import api_key_matches, get_api_key
 from server.utils.exceptions import TenantInactiveError, TenantNotFoundError
 from server.utils.job_execution import initiate_graceful_shutdown, start_shared_workers
+from server.utils.job_logging import flush_job_logs, pending_job_log_count
 from server.utils.log_pruning import scheduled_log_pruning
 from server.utils.maintenance_leader import (
     release_maintenance_leadership,
@@ -192,9 +193,9 @@ async def auth_middleware(request: Request, call_next):
         api_key = await get_api_key(request)
 
         # Check if API key matches tenant-specific API key
-        tenant_api_key = get_tenant_setting(tenant_schema, 'API_KEY')
+        tenant_api_key = get_tenant_api_key(tenant_schema)
 
-        if api_key == tenant_api_key:
+        if api_key_matches(api_key, tenant_api_key):
             return await call_next(request)
         else:
             return JSONResponse(
@@ -399,6 +400,17 @@ async def shutdown_event():
     try:
         timeout = getattr(settings, 'SHUTDOWN_GRACE_PERIOD_SECONDS', 300)
         await initiate_graceful_shutdown(timeout_seconds=timeout)
+        # Persist log entries still queued by the drained jobs, but do not
+        # hold up shutdown indefinitely if the database is unreachable
+        try:
+            await asyncio.wait_for(
+                flush_job_logs(), timeout=settings.JOB_LOG_FLUSH_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                'Timed out writing job logs at shutdown; dropping %d queued entries',
+                pending_job_log_count(),
+            )
     except Exception as e:
         logger.error(f'Error during graceful shutdown: {e}')
     finally:
@@ -5,10 +5,12 @@ This module provides a simple getter function for tenant-specific settings
 that were previously stored in global environment variables.
 """
 
+import time
 from typing import Optional
 
 from server.database.models import TenantSettings
 from server.database.multi_tenancy import with_db
+from server.settings import settings
 
 # Define the tenant-specific settings that were previously global
 TENANT_SETTINGS_DEFAULTS = {
@@ -25,6 +27,12 @@ TENANT_SETTINGS_DEFAULTS = {
     'LEGACYUSE_PROXY_API_KEY': None,
 }
 
+# The tenant API key is checked on every authenticated request; cache it per
+# tenant for settings.API_KEY_CACHE_TTL_SECONDS. Changes made through
+# set_tenant_setting take effect immediately in this process, other processes
+# pick them up within the TTL.
+_api_key_cache: dict[str, tuple[Optional[str], float]] = {}
+
 
 def get_tenant_setting(tenant_schema: str, key: str) -> Optional[str]:
     """
@@ -49,6 +57,30 @@ def get_tenant_setting(tenant_schema: str, key: str) -> Optional[str]:
         return setting.value if setting else default_value
 
 
+def get_tenant_api_key(tenant_schema: str) -> Optional[str]:
+    """
+    Get the tenant's API key, cached for settings.API_KEY_CACHE_TTL_SECONDS.
+
+    Args:
+        tenant_schema: The tenant schema name
+
+    Returns:
+        The tenant's API key setting
+    """
+    ttl = settings.API_KEY_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return get_tenant_setting(tenant_schema, 'API_KEY')
+
+    now = time.monotonic()
+    cached = _api_key_cache.get(tenant_schema)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    api_key = get_tenant_setting(tenant_schema, 'API_KEY')
+    _api_key_cache[tenant_schema] = (api_key, now + ttl)
+    return api_key
+
+
 def set_tenant_setting(tenant_schema: str, key: str, value: str) -> None:
     """
     Set a tenant-specific setting.
@@ -73,3 +105,6 @@ def set_tenant_setting(tenant_schema: str, key: str, value: str) -> None:
             db_tenant.add(setting)
 
         db_tenant.commit()
+
+    if key == 'API_KEY':
+        _api_key_cache.pop(tenant_schema, None)
@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from server import settings_tenant
+from server.settings_tenant import get_tenant_api_key, set_tenant_setting
+
+
+class FakeTenantSettingsSession:
+    """Minimal session for set_tenant_setting: the setting does not exist yet."""
+
+    def query(self, _model):
+        return self
+
+    def filter(self, *_criteria):
+        return self
+
+    def first(self):
+        return None
+
+    def add(self, _setting):
+        pass
+
+    def commit(self):
+        pass
+
+
+@pytest.fixture
+def stored_api_keys(monkeypatch):
+    """Serve API keys from a dict and count the lookups."""
+    stored = {'tenant_a': 'key-1', 'lookups': 0}
+
+    def fake_get_tenant_setting(tenant_schema, key):
+        stored['lookups'] += 1
+        return stored[tenant_schema]
+
+    @contextmanager
+    def fake_with_db(_tenant_schema):
+        yield FakeTenantSettingsSession()
+
+    monkeypatch.setattr(settings_tenant, 'get_tenant_setting', fake_get_tenant_setting)
+    monkeypatch.setattr(settings_tenant, 'with_db', fake_with_db)
+    monkeypatch.setattr(
+        settings_tenant, 'settings', SimpleNamespace(API_KEY_CACHE_TTL_SECONDS=30)
+    )
+    monkeypatch.setattr(settings_tenant, '_api_key_cache', {})
+    return stored
+
+
+def test_get_tenant_api_key_is_cached(stored_api_keys):
+    assert get_tenant_api_key('tenant_a') == 'key-1'
+    stored_api_keys['tenant_a'] = 'key-2'
+    assert get_tenant_api_key('tenant_a') == 'key-1'
+    assert stored_api_keys['lookups'] == 1
+
+
+def test_set_tenant_setting_invalidates_cached_api_key(stored_api_keys):
+    assert get_tenant_api_key('tenant_a') == 'key-1'
+
+    set_tenant_setting('tenant_a', 'API_KEY', 'key-2')
+    stored_api_keys['tenant_a'] = 'key-2'
+
+    assert get_tenant_api_key('tenant_a') == 'key-2'
+    assert stored_api_keys['lookups'] == 2
+
+
+def test_api_key_cache_can_be_disabled(stored_api_keys):
+    settings_tenant.settings.API_KEY_CACHE_TTL_SECONDS = 0
+
+    assert get_tenant_api_key('tenant_a') == 'key-1'
+    stored_api_keys['tenant_a'] = 'key-2'
+    assert get_tenant_api_key('tenant_a') == 'key-2'
+    assert settings_tenant._api_key_cache == {}
@@ -7,7 +7,6 @@ Usage: python tenant_manager.py create <name> <schema> <host>
 import argparse
 import re
 import secrets
-import string
 import sys
 from pathlib import Path
 
@@ -24,11 +23,14 @@ from server.database.multi_tenancy import (
 from server.database.service import DatabaseService
 from server.settings_tenant import set_tenant_setting
 
+SCHEMA_NAME_PATTERN = re.compile(r'^[a-z][a-z0-9_]*$')
+HOST_PATTERN = re.compile(r'^[a-zA-Z0-9.-]+$')
+
 
 def generate_secure_api_key(length: int = 32) -> str:
-    """Generate a secure API key."""
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    """Generate a secure API key of ``length`` URL-safe characters."""
+    # One CSPRNG read encoded once, instead of a secrets.choice call per character
+    return secrets.token_urlsafe(length)[:length]
 
 
 def validate_tenant_data(name: str, schema: str, host: str) -> tuple[bool, str]:
@@ -49,7 +51,7 @@ def validate_tenant_data(name: str, schema: str, host: str) -> tuple[bool, str]:
         return False, 'Schema name must be 256 characters or less'
 
     # Schema should be lowercase and contain only alphanumeric characters and underscores
-    if not re.match(r'^[a-z][a-z0-9_]*$', schema):
+    if not SCHEMA_NAME_PATTERN.match(schema):
         return (
             False,
             'Schema name must start with a letter and contain only lowercase letters, numbers, and underscores',
@@ -63,7 +65,7 @@ def validate_tenant_data(name: str, schema: str, host: str) -> tuple[bool, str]:
         return False, 'Host must be 256 characters or less'
 
     # Basic host validation (should be a valid domain or localhost)
-    if not re.match(r'^[a-zA-Z0-9.-]+$', host) and host != 'localhost':
+    if not HOST_PATTERN.match(host) and host != 'localhost':
         return False, 'Host must be a valid domain name or localhost'
 
     return True, ''
@@ -161,16 +163,18 @@ def list_tenants() -> None:
         print('No tenants found.')
         return
 
-    print(f'Found {len(tenants)} tenant(s):')
-    print()
+    # Collect the listing and write it once rather than printing line by line
+    lines = [f'Found {len(tenants)} tenant(s):', '']
 
     for tenant in tenants:
         status = '🟢 Active' if tenant.get('is_active') else '🔴 Inactive'
-        print(f'  {tenant.get("name", "N/A")} ({status})')
-        print(f'    Schema: {tenant.get("schema", "N/A")}')
-        print(f'    Host: {tenant.get("host", "N/A")}')
-        print(f'    ID: {tenant.get("id", "N/A")}')
-        print()
+        lines.append(f'  {tenant.get("name", "N/A")} ({status})')
+        lines.append(f'    Schema: {tenant.get("schema", "N/A")}')
+        lines.append(f'    Host: {tenant.get("host", "N/A")}')
+        lines.append(f'    ID: {tenant.get("id", "N/A")}')
+        lines.append('')
+
+    print('\n'.join(lines))
 
 
 def main():
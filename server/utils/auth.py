@@ -1,4 +1,6 @@
 import re
+import secrets
+from typing import Optional
 
 from fastapi import HTTPException, Request
 from starlette.status import HTTP_401_UNAUTHORIZED
@@ -26,3 +28,12 @@ async def get_api_key(request: Request):
         return request.cookies.get(vnc_auth_cookie_name)
 
     raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail='API key is missing')
+
+
+def api_key_matches(api_key: Optional[str], expected_api_key: Optional[str]) -> bool:
+    """
+    Compare a provided API key against the expected one in constant time.
+    """
+    if not api_key or not expected_api_key:
+        return False
+    return secrets.compare_digest(api_key.encode(), expected_api_key.encode())
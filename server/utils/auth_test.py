@@ -0,0 +1,24 @@
+from server.utils.auth import api_key_matches
+
+
+def test_api_key_matches_rejects_missing_keys():
+    assert not api_key_matches(None, 'secret-key')
+    assert not api_key_matches('secret-key', None)
+    assert not api_key_matches(None, None)
+    assert not api_key_matches('', 'secret-key')
+    assert not api_key_matches('secret-key', '')
+    assert not api_key_matches('', '')
+
+
+def test_api_key_matches_rejects_mismatches():
+    assert not api_key_matches('wrong-key', 'secret-key')
+    assert not api_key_matches('secret-ke', 'secret-key')
+    assert not api_key_matches('secret-key ', 'secret-key')
+    assert not api_key_matches('SECRET-KEY', 'secret-key')
+
+
+def test_api_key_matches_accepts_the_expected_key():
+    assert api_key_matches('secret-key', 'secret-key')
+    # Non-ASCII keys are compared as UTF-8 rather than rejected
+    assert api_key_matches('clé-secrète', 'clé-secrète')
+    assert not api_key_matches('clé-secrète', 'cle-secrete')
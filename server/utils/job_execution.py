@@ -16,19 +16,24 @@ from datetime import datetime
 from typing import Dict, List
 from uuid import UUID
 
-# Remove direct import of APIGatewayCore
+from server.database.multi_tenancy import with_db
 from server.models.base import Job, JobCreate, JobStatus
 from server.settings import settings
 from server.utils.db_dependencies import TenantAwareDatabaseService
+from server.utils.docker_manager import check_target_container_health
 from server.utils.job_logging import (
-    _create_api_response_callback,
-    _create_output_callback,
-    _create_tool_callback,
+    JobCallbacks,
     add_job_log,
+    flush_job_logs,
 )
-from server.utils.telemetry import capture_job_resolved, tenant_context
-
-# Add import for session management functions
+from server.utils.job_utils import compute_job_metrics
+from server.utils.session_management import launch_session_for_target
+from server.utils.telemetry import (
+    capture_job_resolved,
+    is_tracking_enabled,
+    tenant_context,
+)
+from server.utils.tenant_utils import get_active_tenants
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -41,6 +46,10 @@ shared_worker_lock = asyncio.Lock()
 _rr_index: int = 0  # round-robin starting index across tenants
 WORKER_ID = f'{socket.gethostname()}:{os.getpid()}'
 
+# Tracebacks of failed jobs are written to the job log; cap their size so a
+# deep or chained stack does not bloat the row
+MAX_LOGGED_TRACEBACK_CHARS = 8192
+
 # When set, workers will not claim new jobs and will exit their loops after
 # finishing any in-flight job. Used to support graceful shutdown.
 _drain_mode_event: asyncio.Event | None = None
@@ -81,16 +90,18 @@ async def start_shared_workers(desired_concurrency: int | None = None):
 
 
 async def ensure_shared_workers_running():
-    """Helper to lazily start shared workers if none running."""
-    async with shared_worker_lock:
-        if not any(t for t in shared_worker_tasks if not t.done()):
-            await start_shared_workers()
+    """Helper to lazily start shared workers if none running.
 
+    The common case (workers already alive) is answered without touching
+    ``shared_worker_lock``; ``start_shared_workers`` takes the lock itself, so
+    it must not be awaited while holding it.
+    """
+    if any(not t.done() for t in shared_worker_tasks):
+        return
+    await start_shared_workers()
 
-async def worker_loop_shared():
-    from server.database.multi_tenancy import with_db
-    from server.utils.tenant_utils import get_active_tenants
 
+async def worker_loop_shared():
     global _rr_index
 
     while True:
@@ -110,6 +121,7 @@ async def worker_loop_shared():
             num_tenants = len(tenant_schemas)
             start_idx = _rr_index % num_tenants
             claimed_job = None
+            claimed_data: dict | None = None
             claimed_tenant: str | None = None
 
             for offset in range(num_tenants):
@@ -118,19 +130,22 @@ async def worker_loop_shared():
                 try:
                     with with_db(tenant_schema) as db_session:
                         db = TenantAwareDatabaseService(db_session)
-                        db.expire_stale_running_jobs()
                         claimed = db.claim_next_job(
-                            WORKER_ID, tenant_schema=tenant_schema
+                            WORKER_ID, tenant_schema=tenant_schema, expire_stale=True
                         )
                     if claimed:
-                        claimed_job = Job(**claimed)
+                        # Row comes straight from the ORM, so skip re-validation
+                        claimed_job = Job.model_construct(**claimed)
+                        claimed_data = claimed
                         claimed_tenant = tenant_schema
                         _rr_index = (
                             idx + 1
                         )  # next round starts after the tenant that got work
                         break
                 except Exception as e:
-                    logger.error(f'Error during claim for tenant {tenant_schema}: {e}')
+                    logger.error(
+                        'Error during claim for tenant %s: %s', tenant_schema, e
+                    )
                     # Try next tenant
                     continue
 
@@ -142,7 +157,9 @@ async def worker_loop_shared():
             tenant_schema = claimed_tenant or ''
             try:
                 exec_task = asyncio.create_task(
-                    execute_api_in_background_with_tenant(job, tenant_schema)
+                    execute_api_in_background_with_tenant(
+                        job, tenant_schema, job_data=claimed_data
+                    )
                 )
                 lease_task = asyncio.create_task(
                     _lease_heartbeat(job, tenant_schema, exec_task)
@@ -155,7 +172,7 @@ async def worker_loop_shared():
             finally:
                 lease_task.cancel()
         except Exception as e:
-            logger.error(f'Shared worker loop error: {e}')
+            logger.error('Shared worker loop error: %s', e)
             await asyncio.sleep(1.0)
 
 
@@ -193,7 +210,7 @@ async def initiate_graceful_shutdown(timeout_seconds: int = 300) -> None:
         # Best-effort cancel any remaining running job tasks
         for job_id, task in list(running_job_tasks.items()):
             if not task.done():
-                logger.info(f'Cancelling in-flight job task {job_id}')
+                logger.info('Cancelling in-flight job task %s', job_id)
                 task.cancel()
         # Await cancellation completion (best-effort, short timeout)
         try:
@@ -208,16 +225,13 @@ async def initiate_graceful_shutdown(timeout_seconds: int = 300) -> None:
 
 
 async def _lease_heartbeat(job: Job, tenant_schema: str, exec_task: asyncio.Task):
-    from server.database.multi_tenancy import with_db
-
     try:
         while True:
             await asyncio.sleep(2)
             with with_db(tenant_schema) as db_session:
                 db = TenantAwareDatabaseService(db_session)
-                # Renew lease and check for cancel signal
-                db.renew_job_lease(job.id, WORKER_ID)
-                if db.is_job_cancel_requested(job.id):
+                # Renew lease and check for cancel signal in one round-trip
+                if db.renew_job_lease_and_check_cancel(job.id, WORKER_ID):
                     try:
                         exec_task.cancel()
                     finally:
@@ -237,10 +251,6 @@ async def _wait_for_session_ready(
 
     Returns (is_ready, reason_if_not_ready).
     """
-    from server.database.multi_tenancy import with_db
-    from server.utils.db_dependencies import TenantAwareDatabaseService
-    from server.utils.docker_manager import check_target_container_health
-
     start_ts = time.monotonic()
     last_reason = 'Waiting for session container to become healthy'
 
@@ -277,33 +287,105 @@ async def _wait_for_session_ready(
     return False, f'Timeout waiting for session to become ready: {last_reason}'
 
 
+def _terminal_job_update(status: JobStatus, **fields) -> dict:
+    """Build the update that moves a job into a terminal (or paused) state."""
+    now = datetime.now()
+    return {'status': status, **fields, 'completed_at': now, 'updated_at': now}
+
+
+def _update_job_and_session(tenant_schema: str, job_id: UUID, job_update: dict):
+    """Apply a job update (and its session) on a fresh tenant session.
+
+    Blocking; the runner calls it through ``asyncio.to_thread``.
+    """
+    with with_db(tenant_schema) as db_session:
+        db_service = TenantAwareDatabaseService(db_session)
+        return db_service.update_job(job_id, job_update, update_session=True)
+
+
+async def _finalize_job(tenant_schema: str, job_id: UUID, job_update: dict):
+    """Record a job's final state on a fresh session.
+
+    Shielded, so a cancel arriving meanwhile cannot abandon the write; the
+    worker thread owns its session and finishes it either way.
+    """
+    return await asyncio.shield(
+        asyncio.to_thread(_update_job_and_session, tenant_schema, job_id, job_update)
+    )
+
+
+def _list_job_http_exchanges(tenant_schema: str, job_id: UUID) -> List[dict]:
+    """Read a job's trimmed HTTP exchanges on a fresh tenant session."""
+    with with_db(tenant_schema) as db_session:
+        db_service = TenantAwareDatabaseService(db_session)
+        return db_service.list_job_http_exchanges(job_id, use_trimmed=True)
+
+
+async def _handle_cancellation(
+    job: Job, tenant_schema: str, callbacks: JobCallbacks
+) -> None:
+    """Log and record a cancelled job.
+
+    Jobs cancelled for exceeding the token limit end in ERROR; any other
+    cancellation is a user interrupt and pauses the job.
+    """
+    running_token_total = callbacks.token_counter.total
+    over_token_limit = running_token_total > settings.TOKEN_LIMIT
+
+    if over_token_limit:
+        callbacks.log(
+            'system',
+            f'Job was automatically terminated: exceeded token limit of {settings.TOKEN_LIMIT} tokens (used {running_token_total} tokens)',
+        )
+        status_value = JobStatus.ERROR
+        error_value = 'Job was automatically terminated: exceeded token limit'
+    else:
+        callbacks.log('system', 'API execution was cancelled')
+        status_value = JobStatus.PAUSED
+        error_value = 'Job was interrupted by user'
+
+    await _finalize_job(
+        tenant_schema,
+        job.id,
+        _terminal_job_update(
+            status_value,
+            error=error_value,
+            cancel_requested=False,
+            total_input_tokens=running_token_total // 2,  # Rough estimate
+            total_output_tokens=running_token_total // 2,  # Rough estimate
+        ),
+    )
+
+
 # Main job execution logic
-async def execute_api_in_background_with_tenant(job: Job, tenant_schema: str):
-    """Execute a job's API call in the background."""
-    # Import core only when needed
+async def execute_api_in_background_with_tenant(
+    job: Job, tenant_schema: str, job_data: dict | None = None
+):
+    """Execute a job's API call in the background.
+
+    ``job_data`` is the row returned by the claim query; when given it is
+    handed to the core so the job does not have to be re-read.
+    """
+    # server.core imports server.utils (via computer_use), so import it lazily
     from server.core import APIGatewayCore
-    from server.database.multi_tenancy import with_db
 
     tenant_context.set(tenant_schema)
 
     job_id_str = str(job.id)
 
-    # Track token usage for this job - Use a list to allow modification by nonlocal callback
-    running_token_total_ref = [0]
+    # Logging callbacks for the sampling loop; also track the job's token usage
+    callbacks = JobCallbacks(job_id_str, tenant_schema)
 
-    # Add initial job log
-    add_job_log(job_id_str, 'system', 'Queue picked up job', tenant_schema)
+    # Add initial job log; the runner's own logs share the callbacks' queue
+    callbacks.log('system', 'Queue picked up job')
+
+    # Set once the job's final state is being written; a cancel arriving
+    # after that must not overwrite it
+    job_finalized = False
 
     try:
         # Already RUNNING due to DB claim
 
-        # Create callbacks using helper functions
-        api_response_callback = _create_api_response_callback(
-            job_id_str, running_token_total_ref, tenant_schema
-        )
-        tool_callback = _create_tool_callback(job_id_str, tenant_schema)
-        output_callback = _create_output_callback(job_id_str, tenant_schema)
-
         try:
             # Create tenant-aware database service for the core
             with with_db(tenant_schema) as db_session:
@@ -311,41 +393,31 @@ async def execute_api_in_background_with_tenant(job: Job, tenant_schema: str):
 
                 # If a session is attached to this job, wait for it to be ready before executing
                 if job.session_id:
-                    add_job_log(
-                        job_id_str,
-                        'system',
-                        'Waiting for session to become ready before execution',
-                        tenant_schema,
+                    callbacks.log(
+                        'system', 'Waiting for session to become ready before execution'
                     )
                     is_ready, not_ready_reason = await _wait_for_session_ready(
                         session_id=job.session_id, tenant_schema=tenant_schema
                     )
                     if not is_ready:
-                        updated_job = db_service.update_job(
+                        job_finalized = True
+                        await _finalize_job(
+                            tenant_schema,
                             job.id,
-                            {
-                                'status': JobStatus.PAUSED,
-                                'error': not_ready_reason,
-                                'completed_at': datetime.now(),
-                                'updated_at': datetime.now(),
-                            },
+                            _terminal_job_update(
+                                JobStatus.PAUSED, error=not_ready_reason
+                            ),
                         )
                         logger.info(
-                            f'Target {job.target_id} queue will be paused due to job paused'
+                            'Target %s queue will be paused due to job paused',
+                            job.target_id,
                         )
-                        add_job_log(
-                            job_id_str,
+                        callbacks.log(
                             'system',
                             f'Target {job.target_id} queue will be paused due to job paused',
-                            tenant_schema,
                         )
 
-                        add_job_log(
-                            job_id_str,
-                            'system',
-                            f'Job paused: {not_ready_reason}',
-                            tenant_schema,
-                        )
+                        callbacks.log('system', f'Job paused: {not_ready_reason}')
                         return
 
                 core = APIGatewayCore(tenant_schema=tenant_schema, db_tenant=db_service)
@@ -353,191 +425,137 @@ async def execute_api_in_background_with_tenant(job: Job, tenant_schema: str):
                 # Wrap the execute_api call in its own try-except block to better handle cancellation
                 api_response = await core.execute_api(
                     job_id=job_id_str,
-                    api_response_callback=api_response_callback,
-                    tool_callback=tool_callback,
-                    output_callback=output_callback,
+                    api_response_callback=callbacks.api_response,
+                    tool_callback=callbacks.tool,
+                    output_callback=callbacks.output,
                     session_id=(str(job.session_id) if job.session_id else None),
+                    job_data=job_data,
                 )
 
-            # Update job with result and API exchanges using tenant-aware database service
-            with with_db(tenant_schema) as db_session:
-                db_service = TenantAwareDatabaseService(db_session)
+            # Record the result on a fresh session once the execution session
+            # is closed; telemetry only runs after the job is finalized
+            job_finalized = True
+            updated_job = await _finalize_job(
+                tenant_schema,
+                job.id,
+                _terminal_job_update(
+                    api_response.status, result=api_response.extraction
+                ),
+            )
 
-                # Use the session-aware update method for all job updates
-                updated_job = db_service.update_job(
-                    job.id,
-                    {
-                        'status': api_response.status,
-                        'result': api_response.extraction,
-                        'completed_at': datetime.now(),
-                        'updated_at': datetime.now(),
-                    },
-                    update_session=True,
+            # Include token usage in the job data for telemetry
+            # TODO: This is a hack to get the token usage into the job data for telemetry,
+            # since for some reason that data is returned as None by the DB -> looks like some weird race condition
+
+            # The exchanges are only read for the telemetry event, so skip
+            # the query entirely when tracking is disabled
+            if is_tracking_enabled():
+                # Exchanges are logged through the background writer; make
+                # sure they are all persisted before computing metrics
+                await flush_job_logs(job_id_str)
+
+                http_exchanges = await asyncio.to_thread(
+                    _list_job_http_exchanges, tenant_schema, job.id
                 )
+                metrics = compute_job_metrics(updated_job, http_exchanges)
+                job_with_tokens = {
+                    **updated_job,
+                    'duration_seconds': metrics['duration_seconds'],
+                    'total_input_tokens': metrics['total_input_tokens'],
+                    'total_output_tokens': metrics['total_output_tokens'],
+                }
+
+                capture_job_resolved(None, job_with_tokens, manual_resolution=False)
 
             # Check if the job status is paused or error, which will implicitly pause the target's queue
             if api_response.status in [JobStatus.PAUSED, JobStatus.ERROR]:
                 logger.info(
-                    f'Target {job.target_id} queue will be paused due to job {api_response.status.value}'
+                    'Target %s queue will be paused due to job %s',
+                    job.target_id,
+                    api_response.status.value,
                 )
                 # special message for api credits exceeded
                 if (
                     api_response.status == JobStatus.PAUSED
                     and 'API Credits Exceeded' in str(api_response.reason)
                 ):
-                    add_job_log(
-                        job_id_str,
+                    callbacks.log(
                         'error',
                         f'Target {job.target_id} queue will be paused due to insufficient credits',
-                        tenant_schema,
                     )
                 else:
-                    add_job_log(
-                        job_id_str,
+                    callbacks.log(
                         'system',
                         f'Target {job.target_id} queue will be paused due to job {api_response.status.value}',
-                        tenant_schema,
                     )
 
             msg = f'Job completed with status: {api_response.status}'
             # if status is not success, add the reason
             if api_response.status != JobStatus.SUCCESS:
                 msg += f' and reason: {api_response.reason}'
-            add_job_log(job_id_str, 'system', msg, tenant_schema)
-
-            # Include token usage in the job data for telemetry
-            # TODO: This is a hack to get the token usage into the job data for telemetry,
-            # since for some reason that data is returned as None by the DB -> looks like some weird race condition
-
-            from server.utils.job_utils import compute_job_metrics
-
-            # Use tenant-aware database service for getting HTTP exchanges
-            with with_db(tenant_schema) as db_session:
-                db_service = TenantAwareDatabaseService(db_session)
-                http_exchanges = db_service.list_job_http_exchanges(
-                    job.id, use_trimmed=True
-                )
-                metrics = compute_job_metrics(updated_job, http_exchanges)
-                job_with_tokens = updated_job.copy()
-                job_with_tokens['duration_seconds'] = metrics['duration_seconds']
-                job_with_tokens['total_input_tokens'] = metrics['total_input_tokens']
-                job_with_tokens['total_output_tokens'] = metrics['total_output_tokens']
-
-                capture_job_resolved(None, job_with_tokens, manual_resolution=False)
+            callbacks.log('system', msg)
 
         except asyncio.CancelledError:
-            # Job was cancelled during API execution
-            logger.info(f'Job {job_id_str} was cancelled during API execution')
-
-            # Access the token total from the reference list
-            running_token_total = running_token_total_ref[0]
-
-            # Check if cancellation was due to token limit
-            if running_token_total > settings.TOKEN_LIMIT:
-                error_message = f'Job was automatically terminated: exceeded token limit of {settings.TOKEN_LIMIT} tokens (used {running_token_total} tokens)'
-                add_job_log(job_id_str, 'system', error_message, tenant_schema)
+            if job_finalized:
+                # The job already finished; keep the state it recorded
+                logger.info('Job %s was cancelled after finishing', job_id_str)
             else:
-                add_job_log(
-                    job_id_str, 'system', 'API execution was cancelled', tenant_schema
-                )
-
-            # Update job status: PAUSED if user-interrupted, ERROR if token limit
-            with with_db(tenant_schema) as db_session:
-                db_service = TenantAwareDatabaseService(db_session)
-                user_interrupted = running_token_total <= settings.TOKEN_LIMIT
-                status_value = JobStatus.PAUSED if user_interrupted else JobStatus.ERROR
-                error_value = (
-                    'Job was interrupted by user'
-                    if user_interrupted
-                    else 'Job was automatically terminated: exceeded token limit'
-                )
-
-                # Use the session-aware update method for all job updates
-                db_service.update_job(
-                    job.id,
-                    {
-                        'status': status_value,
-                        'error': error_value,
-                        'completed_at': datetime.now(),
-                        'updated_at': datetime.now(),
-                        'cancel_requested': False,
-                        'total_input_tokens': running_token_total
-                        // 2,  # Rough estimate
-                        'total_output_tokens': running_token_total
-                        // 2,  # Rough estimate
-                    },
-                    update_session=True,
-                )
+                # Job was cancelled during API execution
+                logger.info('Job %s was cancelled during API execution', job_id_str)
+                await _handle_cancellation(job, tenant_schema, callbacks)
 
             # Re-raise to be caught by the outer try-except
             raise
 
     except asyncio.CancelledError:
-        # Job was cancelled, already handled in interrupt_job or inner try-except
-        logger.info(f'Job {job_id_str} was cancelled')
-
-        # Access the token total from the reference list
-        running_token_total = running_token_total_ref[0]
-
-        # Check if this was due to token limit
-        if running_token_total > settings.TOKEN_LIMIT:
-            add_job_log(
-                job_id_str,
-                'system',
-                f'Job execution was cancelled due to token limit ({running_token_total}/{settings.TOKEN_LIMIT})',
-                tenant_schema,
-            )
-        else:
-            add_job_log(
-                job_id_str, 'system', 'Job execution was cancelled', tenant_schema
-            )
-
-        # No in-memory locks to clean up
-
-        # Remove the task from running_job_tasks
-        if job_id_str in running_job_tasks:
-            del running_job_tasks[job_id_str]
-
-        # No chained processing here; worker loop will pick next claim
+        # Already logged and recorded by the inner handler; the worker loop
+        # will pick the next claim
+        logger.info('Job %s was cancelled', job_id_str)
 
     except Exception as e:
         error_message = str(e)
-        error_traceback = ''.join(
-            traceback.format_exception(type(e), e, e.__traceback__)
-        )
+        error_traceback = ''.join(traceback.format_exception(e))
+        if len(error_traceback) > MAX_LOGGED_TRACEBACK_CHARS:
+            # Keep the innermost frames and the exception itself
+            error_traceback = '...\n' + error_traceback[-MAX_LOGGED_TRACEBACK_CHARS:]
 
-        # Update job with error using tenant-aware database service
-        with with_db(tenant_schema) as db_session:
-            db_service = TenantAwareDatabaseService(db_session)
-            # Use the session-aware update method
-            db_service.update_job(
+        # Update job with error
+        try:
+            await _finalize_job(
+                tenant_schema,
                 job.id,
-                {
-                    'status': JobStatus.ERROR,
-                    'error': error_message,
-                    'completed_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                },
-                update_session=True,
+                _terminal_job_update(JobStatus.ERROR, error=error_message),
             )
-
-        # Log that the target queue will be paused
-        logger.info(f'Target {job.target_id} queue will be paused due to job error')
-        add_job_log(
-            job_id_str,
-            'system',
-            f'Target {job.target_id} queue will be paused due to job error',
-            tenant_schema,
-        )
-
-        # Log the error
-        add_job_log(
-            job_id_str, 'system', f'Error executing job: {error_message}', tenant_schema
+        except asyncio.CancelledError:
+            # The shielded write still lands; a late cancel must not escape
+            # into the shared worker loop
+            logger.info('Job %s was cancelled while recording its error', job_id_str)
+
+        # Log that the target queue will be paused, then the error itself
+        logger.info('Target %s queue will be paused due to job error', job.target_id)
+        callbacks.log(
+            'system', f'Target {job.target_id} queue will be paused due to job error'
         )
-        add_job_log(job_id_str, 'error', error_traceback, tenant_schema)
+        callbacks.log('system', f'Error executing job: {error_message}')
+        callbacks.log('error', error_traceback)
     finally:
-        if job_id_str in running_job_tasks:
-            del running_job_tasks[job_id_str]
+        # Single exit point for bookkeeping; safe if the worker already popped it
+        running_job_tasks.pop(job_id_str, None)
+        # Persist the job's queued callback logs before the worker moves on,
+        # including when the job was cancelled or failed mid-exchange; only
+        # this job's entries are waited for, not the whole shared queue
+        try:
+            await flush_job_logs(job_id_str)
+        except asyncio.CancelledError:
+            # The writer still persists the entries; a late cancel must not
+            # escape into the shared worker loop
+            logger.info('Job %s was cancelled while flushing its logs', job_id_str)
+
+
+async def _job_queued(job_obj: Job, tenant_schema: str) -> None:
+    """Steps shared by every enqueue path once a job is stored as QUEUED."""
+    add_job_log(str(job_obj.id), 'system', 'Job added to queue', tenant_schema)
+    await ensure_shared_workers_running()
 
 
 async def enqueue_job(job_obj: Job, tenant_schema: str):
@@ -549,13 +567,10 @@ async def enqueue_job(job_obj: Job, tenant_schema: str):
         job_obj: The Job Pydantic model instance to enqueue.
         tenant_schema: The tenant schema for this job.
     """
-    from server.database.multi_tenancy import with_db
-
     with with_db(tenant_schema) as db_session:
         db_service = TenantAwareDatabaseService(db_session)
         db_service.update_job_status(job_obj.id, JobStatus.QUEUED)
-    add_job_log(str(job_obj.id), 'system', 'Job added to queue', tenant_schema)
-    await ensure_shared_workers_running()
+    await _job_queued(job_obj, tenant_schema)
 
 
 async def create_and_enqueue_job(
@@ -563,11 +578,12 @@ async def create_and_enqueue_job(
 ) -> Job:
     """Create a job for target and enqueue it. Handles session and API version."""
     from server.core import APIGatewayCore
-    from server.database.multi_tenancy import with_db
 
-    # Build initial job data
+    # Build initial job data; the row is inserted already QUEUED so enqueueing
+    # does not need a second write
     job_data = job_create.model_dump()
     job_data['target_id'] = target_id
+    job_data['status'] = JobStatus.QUEUED
 
     # Ensure session
     if not job_data.get('session_id'):
@@ -578,10 +594,6 @@ async def create_and_enqueue_job(
                 if active['has_active_session']:
                     job_data['session_id'] = active['session']['id']
                 else:
-                    from server.utils.session_management import (
-                        launch_session_for_target,
-                    )
-
                     session_info = await launch_session_for_target(
                         str(target_id), tenant_schema
                     )
@@ -605,5 +617,5 @@ async def create_and_enqueue_job(
         db_job_dict = db.create_job(job_data)
 
     job_obj = Job(**db_job_dict)
-    await enqueue_job(job_obj, tenant_schema)
+    await _job_queued(job_obj, tenant_schema)
     return job_obj
@@ -2,37 +2,66 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Any, List
+from functools import partial
+from typing import Any, List, Optional, Tuple
 
 import httpx
 
+from server.database.multi_tenancy import with_db
 from server.settings import settings
 from server.utils.db_dependencies import TenantAwareDatabaseService
 
 logger = logging.getLogger(__name__)
 
+# Log entries produced by the sampling-loop callbacks are queued and persisted
+# by a single background writer, so the callbacks (which run on the event loop
+# in the middle of a job) never wait on a database round-trip.
+JOB_LOG_BATCH_SIZE = 64
+# Upper bound on entries waiting for the writer; past it (e.g. while the
+# database is unreachable) new entries are dropped instead of piling up
+JOB_LOG_QUEUE_MAXSIZE = 10_000
+_job_log_queue: asyncio.Queue | None = None
+_job_log_writer_task: asyncio.Task | None = None
+
+
+class _PendingJobLogs:
+    """Queued entries of one job that the writer has not handled yet."""
+
+    __slots__ = ('count', 'written')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.written = asyncio.Event()
+
+
+# Keyed by str(job_id), so a job can wait for its own entries only
+_pending_job_logs: dict[str, _PendingJobLogs] = {}
+
 
 def trim_base64_images(data: Any) -> Any:
     """
-    Recursively search and trim base64 image data in content structure.
+    Search and trim base64 image data in content structure.
 
-    This function traverses a nested dictionary/list structure and replaces
-    base64 image data with "..." to reduce log size.
+    This function walks a nested dictionary/list structure in place and
+    replaces base64 image data with "..." to reduce log size. Only the image
+    sources are written to; every other node is left untouched.
     """
-    if isinstance(data, dict):
-        if (
-            data.get('type') == 'image'
-            and isinstance(data.get('source'), dict)
-            and data['source'].get('type') == 'base64'
-            and 'data' in data['source']
-        ):
-            data['source']['data'] = '...'
-        else:
-            for key, value in data.items():
-                data[key] = trim_base64_images(value)
-    elif isinstance(data, list):
-        for i, item in enumerate(data):
-            data[i] = trim_base64_images(item)
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            source = node.get('source')
+            if (
+                node.get('type') == 'image'
+                and isinstance(source, dict)
+                and source.get('type') == 'base64'
+                and 'data' in source
+            ):
+                source['data'] = '...'
+            else:
+                stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
 
     return data
 
@@ -58,153 +87,445 @@ def trim_http_body(body: Any) -> Any:
         else:
             return body
     except Exception as e:  # noqa: BLE001 - safe logging util
-        logger.error(f'Error trimming HTTP body: {str(e)}')
+        logger.error('Error trimming HTTP body: %s', e)
         return '<trim error>'
 
 
-def add_job_log(job_id: str, log_type: str, content: Any, tenant_schema: str) -> None:
-    """Add a log entry for a job with tenant context."""
-    from server.database.multi_tenancy import with_db
+# Bodies longer than this are logged as head + tail around an elision marker,
+# after stripping the base64 images of JSON bodies; body_size still records
+# the full length.
+MAX_LOGGED_BODY_CHARS = 256 * 1024
+
+# Non text/* media types whose bodies are still worth keeping as text
+_TEXTUAL_MEDIA_TYPES = frozenset(
+    {
+        'application/json',
+        'application/javascript',
+        'application/x-www-form-urlencoded',
+        'application/xml',
+    }
+)
+
+
+def _truncate_body(body: str) -> str:
+    """Keep the head and tail of an oversized body for the log."""
+    if len(body) <= MAX_LOGGED_BODY_CHARS:
+        return body
+    keep = MAX_LOGGED_BODY_CHARS // 2
+    elided = len(body) - 2 * keep
+    return f'{body[:keep]}\n...[{elided} characters elided]...\n{body[-keep:]}'
+
+
+def _has_loggable_images(text: str) -> bool:
+    """Whether an oversized body may shrink by stripping its base64 images.
+
+    The substring probe is cheap; only bodies that pass it are worth parsing.
+    """
+    return len(text) > MAX_LOGGED_BODY_CHARS and '"base64"' in text
+
+
+def _parse_json_body(text: str, content_type: str) -> Any:
+    """Parse a body that is (or may be) JSON; None when it is not."""
+    if not _is_json_media_type(content_type) or text.lstrip()[:1] not in ('{', '['):
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def _loggable_body(text: str, body_json: Any = None) -> str:
+    """Shrink an oversized body for the log.
+
+    Computer-use request bodies are mostly base64 screenshots, so a parsed
+    JSON body has its images stripped first and stays parseable; only what is
+    still over the cap (or a body that is not JSON) is cut to head + tail.
+    ``body_json`` is trimmed in place.
+    """
+    if len(text) <= MAX_LOGGED_BODY_CHARS:
+        return text
+    if body_json is not None and _has_loggable_images(text):
+        text = json.dumps(trim_base64_images(body_json))
+    return _truncate_body(text)
+
+
+def _headers_dict(headers: Any) -> dict:
+    """Snapshot headers as a plain dict for the log.
+
+    ``dict(httpx.Headers)`` looks every key up again, rescanning the header
+    list each time; ``items()`` merges repeated headers in a single pass and
+    yields the same mapping.
+    """
+    return dict(headers.items())
+
+
+def _read_body(message: Any) -> bytes:
+    """Return the raw body of an httpx request/response, reading it only once."""
+    read = getattr(message, 'read', None)
+    if read is not None:
+        return read() or b''
+    return getattr(message, 'content', None) or getattr(message, '_content', b'') or b''
+
+
+def _is_json_media_type(content_type: str) -> bool:
+    """Whether a body of this content-type may be JSON; untyped bodies may be."""
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    return (
+        not media_type
+        or media_type == 'application/json'
+        or media_type.endswith('+json')
+    )
+
+
+def _decode_body(body: bytes, content_type: str = '') -> str:
+    """Decode a body for logging; binary payloads are replaced by a marker.
+
+    Bodies declared as non-textual media are not scanned at all.
+    """
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    if (
+        media_type
+        and not media_type.startswith('text/')
+        and not media_type.endswith(('+json', '+xml'))
+        and media_type not in _TEXTUAL_MEDIA_TYPES
+    ):
+        return '<binary data>'
+    try:
+        return body.decode('utf-8')
+    except UnicodeDecodeError:
+        return '<binary data>'
+
+
+def _capture_body(
+    message: Any, headers: dict, label: str, parse_json: bool = False
+) -> Tuple[Any, dict]:
+    """Read a request/response body once and build its log fields.
+
+    Returns the parsed JSON body and the ``body_size``/``body`` entries of the
+    exchange record. The body is parsed at most once: always when
+    ``parse_json`` is set, otherwise only if it is oversized and may carry
+    images to strip. The parsed body is None when it was not parsed or is not
+    JSON.
+    """
+    try:
+        body = _read_body(message)
+        content_type = headers.get('content-type', '')
+        text = _decode_body(body, content_type)
+        body_json = None
+        if parse_json or _has_loggable_images(text):
+            body_json = _parse_json_body(text, content_type)
+        return body_json, {
+            'body_size': len(body),
+            'body': _loggable_body(text, body_json),
+        }
+    except Exception as e:  # noqa: BLE001 - safe logging util
+        logger.error('Error getting %s body: %s', label, e)
+        return None, {'body_size': -1, 'body': f'<Error retrieving body: {str(e)}>'}
+
+
+def add_job_log(
+    job_id: str,
+    log_type: str,
+    content: Any,
+    tenant_schema: str,
+    timestamp: Optional[datetime] = None,
+) -> None:
+    """Add a log entry for a job with tenant context.
 
+    ``timestamp`` defaults to the insert time; callers that already read the
+    clock for the entry pass it so the row and its content agree.
+    """
     with with_db(tenant_schema) as db_session:
         db_service = TenantAwareDatabaseService(db_session)
 
-        trimmed_content = trim_base64_images(content)
+        log_data = _build_job_log(job_id, log_type, content)
+        if timestamp is not None:
+            log_data['timestamp'] = timestamp
 
-        log_data = {
-            'job_id': job_id,
-            'log_type': log_type,
-            'content': content,
-            'content_trimmed': trimmed_content,
+        db_service.create_job_log(log_data)
+        logger.info(
+            'Added %s log for job %s in tenant %s', log_type, job_id, tenant_schema
+        )
+
+
+class TokenCounter:
+    """Running token total of a job, shared by its callbacks and its runner.
+
+    The callbacks run on the event loop, so plain attribute updates are safe.
+    """
+
+    __slots__ = ('total',)
+
+    def __init__(self) -> None:
+        self.total = 0
+
+
+# (usage field, exchange field, numerator, denominator): cache writes count as
+# 1.25 input tokens and cache reads as 0.1, rounded down
+_USAGE_TOKEN_WEIGHTS = (
+    ('input_tokens', 'input_tokens', 1, 1),
+    ('output_tokens', 'output_tokens', 1, 1),
+    ('cache_creation_input_tokens', 'cache_creation_tokens', 5, 4),
+    ('cache_read_input_tokens', 'cache_read_tokens', 1, 10),
+)
+
+
+def _weighted_usage_tokens(usage: dict) -> dict[str, int]:
+    """Map an API usage block to the token counts recorded on an exchange.
+
+    Integer arithmetic gives the same result as the float formulas. Fields
+    that are missing or null are left out.
+    """
+    tokens = {}
+    for usage_key, exchange_key, numerator, denominator in _USAGE_TOKEN_WEIGHTS:
+        count = usage.get(usage_key)
+        if count is not None:
+            tokens[exchange_key] = count * numerator // denominator
+    return tokens
+
+
+def _build_job_log(job_id: str, log_type: str, content: Any) -> dict:
+    # Plain-text entries (most system logs) have no images to look for
+    if isinstance(content, (dict, list)):
+        trimmed_content = trim_base64_images(content)
+    else:
+        trimmed_content = content
+    if isinstance(trimmed_content, dict) and 'base64_image' in trimmed_content:
+        # Tool screenshots are only ever read from the full content; do not
+        # store a second copy of the image in the trimmed column
+        trimmed_content = {
+            key: value
+            for key, value in trimmed_content.items()
+            if key != 'base64_image'
         }
 
-        db_service.create_job_log(log_data)
-        logger.info(f'Added {log_type} log for job {job_id} in tenant {tenant_schema}')
+    return {
+        'job_id': job_id,
+        'log_type': log_type,
+        'content': content,
+        # Readers fall back to content, so do not store the same value twice
+        'content_trimmed': None if trimmed_content is content else trimmed_content,
+    }
+
+
+def _get_job_log_queue() -> asyncio.Queue:
+    global _job_log_queue
+    if _job_log_queue is None:
+        _job_log_queue = asyncio.Queue(maxsize=JOB_LOG_QUEUE_MAXSIZE)
+    return _job_log_queue
 
 
-def _create_api_response_callback(
-    job_id_str: str, running_token_total_ref: List[int], tenant_schema: str
-):
-    """Creates the callback function for handling API responses."""
+def _ensure_job_log_writer() -> None:
+    global _job_log_writer_task
+    if _job_log_writer_task is None or _job_log_writer_task.done():
+        _job_log_writer_task = asyncio.create_task(_job_log_writer())
+
+
+def enqueue_job_log(
+    job_id: str,
+    log_type: str,
+    content: Any,
+    tenant_schema: str,
+    timestamp: Optional[datetime] = None,
+) -> None:
+    """Queue a log entry for the background writer and return immediately.
+
+    The timestamp is taken now, so entries keep their order relative to logs
+    written directly with ``add_job_log``. Must be called from the event loop.
+    """
+    log_data = _build_job_log(job_id, log_type, content)
+    log_data['timestamp'] = timestamp or datetime.now()
+    try:
+        _get_job_log_queue().put_nowait((tenant_schema, log_data))
+    except asyncio.QueueFull:
+        logger.warning(
+            'Job log queue is full; dropping %s log for job %s in tenant %s',
+            log_type,
+            job_id,
+            tenant_schema,
+        )
+        return
+    pending = _pending_job_logs.get(str(job_id))
+    if pending is None:
+        pending = _pending_job_logs[str(job_id)] = _PendingJobLogs()
+    pending.count += 1
+    _ensure_job_log_writer()
+
+
+def _job_log_handled(job_id: Any) -> None:
+    pending = _pending_job_logs.get(str(job_id))
+    if pending is None:
+        return
+    pending.count -= 1
+    if pending.count == 0:
+        del _pending_job_logs[str(job_id)]
+        pending.written.set()
+
+
+def pending_job_log_count() -> int:
+    """Number of queued log entries the writer has not handled yet."""
+    return sum(pending.count for pending in _pending_job_logs.values())
+
+
+async def flush_job_logs(job_id: Optional[str] = None) -> None:
+    """Wait until the queued log entries have been written.
+
+    With a ``job_id`` only that job's entries are waited for, so a finishing
+    job does not wait on other jobs' or tenants' writes; without one, the
+    whole queue is drained (used at shutdown).
+    """
+    if _job_log_queue is None:
+        return
+    if job_id is None:
+        if not _job_log_queue.empty():
+            _ensure_job_log_writer()
+        await _job_log_queue.join()
+        return
+    pending = _pending_job_logs.get(str(job_id))
+    if pending is None:
+        return
+    _ensure_job_log_writer()
+    await pending.written.wait()
+
+
+def _write_tenant_job_logs(tenant_schema: str, logs: List[dict]) -> None:
+    """Insert one tenant's share of a batch, row by row if the batch fails.
+
+    A bad entry or a failing tenant then only costs the rows that cannot be
+    written, not the rest of the batch.
+    """
+    try:
+        with with_db(tenant_schema) as db_session:
+            TenantAwareDatabaseService(db_session).create_job_logs(logs)
+        logger.debug(
+            'Added %d queued job log(s) in tenant %s', len(logs), tenant_schema
+        )
+        return
+    except Exception as e:  # noqa: BLE001 - fall back to single inserts
+        logger.warning(
+            'Error writing %d job log(s) in tenant %s, retrying one by one: %s',
+            len(logs),
+            tenant_schema,
+            e,
+        )
+
+    for log_data in logs:
+        try:
+            with with_db(tenant_schema) as db_session:
+                TenantAwareDatabaseService(db_session).create_job_log(log_data)
+        except Exception as e:  # noqa: BLE001 - safe logging util
+            logger.error(
+                'Error writing %s log for job %s in tenant %s: %s',
+                log_data['log_type'],
+                log_data['job_id'],
+                tenant_schema,
+                e,
+            )
+
+
+def _write_job_log_batch(batch: List[tuple]) -> None:
+    logs_by_tenant: dict[str, list[dict]] = {}
+    for tenant_schema, log_data in batch:
+        logs_by_tenant.setdefault(tenant_schema, []).append(log_data)
+
+    for tenant_schema, logs in logs_by_tenant.items():
+        _write_tenant_job_logs(tenant_schema, logs)
+
+
+async def _job_log_writer() -> None:
+    queue = _get_job_log_queue()
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < JOB_LOG_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            # Serializing and inserting the batch is blocking work; keep it
+            # off the event loop the callbacks and jobs are running on
+            await asyncio.to_thread(_write_job_log_batch, batch)
+        except Exception as e:  # noqa: BLE001 - keep the writer alive
+            logger.error('Error writing %d job log(s): %s', len(batch), e)
+        finally:
+            for _, log_data in batch:
+                _job_log_handled(log_data['job_id'])
+                queue.task_done()
+
+
+class JobCallbacks:
+    """Callbacks handed to the sampling loop for a single job.
+
+    Must be created from the task running the job: that task is the one
+    cancelled when the token limit is exceeded. The callbacks queue their log
+    entries with ``enqueue_job_log``, so like it they must be invoked on the
+    event loop thread, which is where the sampling loop calls them.
+    """
+
+    __slots__ = (
+        'job_id',
+        'tenant_schema',
+        'token_counter',
+        'log',
+        '_task',
+    )
+
+    def __init__(self, job_id: str, tenant_schema: str) -> None:
+        self.job_id = job_id
+        self.tenant_schema = tenant_schema
+        self.token_counter = TokenCounter()
+        # enqueue_job_log bound to this job and tenant; the job runner queues
+        # its own entries through it too
+        self.log = partial(enqueue_job_log, job_id, tenant_schema=tenant_schema)
+        self._task = asyncio.current_task()
+
+    def api_response(self, request, response, error) -> None:
+        """Log an HTTP exchange and enforce the job's token limit."""
+        # One clock read per exchange, shared by the content and the log row
+        now = datetime.now()
+
+        if self.token_counter.total > settings.TOKEN_LIMIT:
+            # The job is already being cancelled for exceeding the token limit;
+            # note the late exchange without copying headers and bodies
+            self.log(
+                'http_exchange',
+                {
+                    'timestamp': now.isoformat(),
+                    'request': {
+                        'method': getattr(request, 'method', None),
+                        'url': str(getattr(request, 'url', '')),
+                    },
+                    'token_limit_exceeded': True,
+                },
+                timestamp=now,
+            )
+            return
 
-    def api_response_callback(request, response, error):
-        nonlocal running_token_total_ref
         exchange = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'request': {
                 'method': getattr(request, 'method', None),
                 'url': str(getattr(request, 'url', '')),
-                'headers': dict(getattr(request, 'headers', {})),
             },
         }
 
-        try:
-            if hasattr(request, 'read'):
-                body_bytes = request.read()
-                if body_bytes:
-                    exchange['request']['body_size'] = len(body_bytes)
-                    try:
-                        exchange['request']['body'] = body_bytes.decode('utf-8')
-                    except UnicodeDecodeError:
-                        exchange['request']['body'] = '<binary data>'
-                else:
-                    exchange['request']['body_size'] = 0
-                    exchange['request']['body'] = ''
-            elif hasattr(request, 'content') and request.content:
-                exchange['request']['body_size'] = len(request.content)
-                try:
-                    exchange['request']['body'] = request.content.decode('utf-8')
-                except UnicodeDecodeError:
-                    exchange['request']['body'] = '<binary data>'
-            elif hasattr(request, '_content') and request._content:
-                exchange['request']['body_size'] = len(request._content)
-                try:
-                    exchange['request']['body'] = request._content.decode('utf-8')
-                except UnicodeDecodeError:
-                    exchange['request']['body'] = '<binary data>'
-            else:
-                exchange['request']['body_size'] = 0
-                exchange['request']['body'] = ''
-        except Exception as e:  # noqa: BLE001 - safe logging util
-            logger.error(f'Error getting request body: {str(e)}')
-            exchange['request']['body_size'] = -1
-            exchange['request']['body'] = f'<Error retrieving body: {str(e)}>'
-
         if isinstance(response, httpx.Response):
+            response_headers = _headers_dict(response.headers)
+            # Parsed once here, for both the logged body and the usage below
+            response_data, response_body_fields = _capture_body(
+                response, response_headers, 'response', parse_json=True
+            )
             exchange['response'] = {
                 'status_code': response.status_code,
-                'headers': dict(response.headers),
+                'headers': response_headers,
+                **response_body_fields,
             }
 
             try:
-                if hasattr(response, 'text'):
-                    exchange['response']['body'] = response.text
-                    exchange['response']['body_size'] = len(
-                        response.text.encode('utf-8')
-                    )
-                elif hasattr(response, 'content') and response.content:
-                    exchange['response']['body_size'] = len(response.content)
-                    try:
-                        exchange['response']['body'] = response.content.decode('utf-8')
-                    except UnicodeDecodeError:
-                        exchange['response']['body'] = '<binary data>'
-                else:
-                    exchange['response']['body_size'] = 0
-                    exchange['response']['body'] = ''
+                # Only JSON objects can carry usage, so skip anything else
+                if isinstance(response_data, dict) and 'usage' in response_data:
+                    usage_tokens = _weighted_usage_tokens(response_data['usage'])
+                    exchange.update(usage_tokens)
+                    self._add_tokens(sum(usage_tokens.values()), exchange)
             except Exception as e:  # noqa: BLE001 - safe logging util
-                logger.error(f'Error getting response body: {str(e)}')
-                exchange['response']['body_size'] = -1
-                exchange['response']['body'] = f'<Error retrieving body: {str(e)}>'
-
-            try:
-                if hasattr(response, 'json'):
-                    response_data = response.json()
-                    if isinstance(response_data, dict) and 'usage' in response_data:
-                        usage = response_data['usage']
-                        total_tokens = 0
-
-                        if 'input_tokens' in usage:
-                            total_tokens += usage['input_tokens']
-                            exchange['input_tokens'] = usage['input_tokens']
-
-                        if 'output_tokens' in usage:
-                            total_tokens += usage['output_tokens']
-                            exchange['output_tokens'] = usage['output_tokens']
-
-                        if 'cache_creation_input_tokens' in usage:
-                            cache_creation_tokens = int(
-                                usage['cache_creation_input_tokens'] * 1.25
-                            )
-                            total_tokens += cache_creation_tokens
-                            exchange['cache_creation_tokens'] = cache_creation_tokens
-
-                        if 'cache_read_input_tokens' in usage:
-                            cache_read_tokens = int(
-                                usage['cache_read_input_tokens'] / 10
-                            )
-                            total_tokens += cache_read_tokens
-                            exchange['cache_read_tokens'] = cache_read_tokens
-
-                        current_total = running_token_total_ref[0]
-                        current_total += total_tokens
-                        running_token_total_ref[0] = current_total
-
-                        if current_total > settings.TOKEN_LIMIT:
-                            limit_message = (
-                                f'Token usage limit of {settings.TOKEN_LIMIT} exceeded. '
-                                f'Current usage: {current_total}. Job will be interrupted.'
-                            )
-                            exchange['token_limit_exceeded'] = True
-                            logger.warning(f'Job {job_id_str}: {limit_message}')
-                            add_job_log(
-                                job_id_str, 'system', limit_message, tenant_schema
-                            )
-
-                            task = asyncio.current_task()
-                            if task:
-                                task.cancel()
-            except Exception as e:  # noqa: BLE001 - safe logging util
-                logger.error(f'Error extracting token usage: {repr(e)}')
+                logger.error('Error extracting token usage: %r', e)
 
         if error:
             exchange['error'] = {
@@ -212,38 +533,52 @@ def _create_api_response_callback(
                 'message': str(error),
             }
 
-        add_job_log(job_id_str, 'http_exchange', exchange, tenant_schema)
-
-    return api_response_callback
-
-
-def _create_tool_callback(job_id_str: str, tenant_schema: str):
-    """Creates the callback function for handling tool usage."""
-
-    def tool_callback(tool_result, tool_id):
+        if exchange.get('token_limit_exceeded'):
+            # This exchange pushed the job over its token limit and the job is
+            # being cancelled; keep its usage and status but not the payloads
+            response_log = exchange.get('response')
+            if response_log is not None:
+                del response_log['headers'], response_log['body']
+        else:
+            request_headers = _headers_dict(getattr(request, 'headers', {}))
+            _, request_body_fields = _capture_body(request, request_headers, 'request')
+            exchange['request']['headers'] = request_headers
+            exchange['request'].update(request_body_fields)
+
+        self.log('http_exchange', exchange, timestamp=now)
+
+    def _add_tokens(self, tokens: int, exchange: dict) -> None:
+        self.token_counter.total += tokens
+        current_total = self.token_counter.total
+
+        if current_total > settings.TOKEN_LIMIT:
+            limit_message = (
+                f'Token usage limit of {settings.TOKEN_LIMIT} exceeded. '
+                f'Current usage: {current_total}. Job will be interrupted.'
+            )
+            exchange['token_limit_exceeded'] = True
+            logger.warning('Job %s: %s', self.job_id, limit_message)
+            self.log('system', limit_message)
+
+            if self._task is not None:
+                # Lands at the job's next await, after this exchange is logged
+                self._task.cancel()
+
+    def tool(self, tool_result, tool_id) -> None:
+        """Log the result of a tool call, including its screenshot if any."""
+        base64_image = getattr(tool_result, 'base64_image', None)
         tool_log = {
             'tool_id': tool_id,
             'output': getattr(tool_result, 'output', None),
             'error': getattr(tool_result, 'error', None),
-            'has_image': hasattr(tool_result, 'base64_image')
-            and getattr(tool_result, 'base64_image') is not None,
+            'has_image': base64_image is not None,
         }
 
-        if (
-            hasattr(tool_result, 'base64_image')
-            and tool_result.base64_image is not None
-        ):
-            tool_log['base64_image'] = tool_result.base64_image
-
-        add_job_log(job_id_str, 'tool_use', tool_log, tenant_schema)
-
-    return tool_callback
-
-
-def _create_output_callback(job_id_str: str, tenant_schema: str):
-    """Creates the callback function for handling message output."""
+        if base64_image is not None:
+            tool_log['base64_image'] = base64_image
 
-    def output_callback(content_block):
-        add_job_log(job_id_str, 'message', content_block, tenant_schema)
+        self.log('tool_use', tool_log)
 
-    return output_callback
+    def output(self, content_block) -> None:
+        """Log a content block produced by the model."""
+        self.log('message', content_block)
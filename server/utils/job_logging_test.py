@@ -0,0 +1,269 @@
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from server.utils import job_logging
+from server.utils.job_logging import (
+    MAX_LOGGED_BODY_CHARS,
+    _capture_body,
+    _decode_body,
+    _is_json_media_type,
+    _truncate_body,
+    _weighted_usage_tokens,
+    enqueue_job_log,
+    flush_job_logs,
+    pending_job_log_count,
+    trim_base64_images,
+)
+
+
+def test_weighted_usage_tokens_matches_float_formulas():
+    for count in [*range(0, 2000), 123_456, 999_999, 4_000_001]:
+        tokens = _weighted_usage_tokens(
+            {
+                'cache_creation_input_tokens': count,
+                'cache_read_input_tokens': count,
+            }
+        )
+        assert tokens['cache_creation_tokens'] == int(count * 1.25)
+        assert tokens['cache_read_tokens'] == int(count / 10)
+
+
+def test_weighted_usage_tokens_only_reports_present_fields():
+    tokens = _weighted_usage_tokens({'input_tokens': 10, 'output_tokens': 5})
+    assert tokens == {'input_tokens': 10, 'output_tokens': 5}
+    assert _weighted_usage_tokens({}) == {}
+    assert _weighted_usage_tokens(
+        {'input_tokens': 10, 'cache_read_input_tokens': None}
+    ) == {'input_tokens': 10}
+
+
+def test_decode_body_skips_binary_media_types():
+    assert _decode_body(b'{"a": 1}', 'application/json; charset=utf-8') == '{"a": 1}'
+    assert _decode_body(b'plain', 'text/plain') == 'plain'
+    assert _decode_body(b'untyped') == 'untyped'
+    assert _decode_body(b'\x89PNG', 'image/png') == '<binary data>'
+    assert _decode_body(b'\xff\xfe') == '<binary data>'
+
+
+def test_is_json_media_type():
+    assert _is_json_media_type('application/json; charset=utf-8')
+    assert _is_json_media_type('application/problem+json')
+    assert _is_json_media_type('')
+    assert not _is_json_media_type('text/event-stream')
+    assert not _is_json_media_type('text/html')
+
+
+def test_truncate_body_keeps_head_and_tail():
+    assert _truncate_body('short') == 'short'
+
+    body = 'a' * MAX_LOGGED_BODY_CHARS + 'b' * 1000
+    truncated = _truncate_body(body)
+    assert len(truncated) < len(body)
+    assert truncated.startswith('a' * 100)
+    assert truncated.endswith('b' * 1000)
+    assert '[1000 characters elided]' in truncated
+
+
+def _message(body: str):
+    return SimpleNamespace(read=lambda: body.encode())
+
+
+def test_capture_body_strips_images_before_truncating():
+    screenshot = {
+        'type': 'image',
+        'source': {'type': 'base64', 'data': 'A' * MAX_LOGGED_BODY_CHARS},
+    }
+    body = json.dumps({'messages': [{'role': 'user', 'content': [screenshot]}]})
+    headers = {'content-type': 'application/json'}
+
+    body_json, fields = _capture_body(_message(body), headers, 'request')
+    assert fields['body_size'] == len(body)
+    assert json.loads(fields['body']) == body_json
+    assert body_json['messages'][0]['content'][0]['source']['data'] == '...'
+
+
+def test_capture_body_keeps_head_and_tail_of_other_oversized_bodies():
+    invalid = '{"type": "base64", ' + 'x' * MAX_LOGGED_BODY_CHARS
+    body_json, fields = _capture_body(_message(invalid), {}, 'request')
+    assert body_json is None
+    assert fields['body'] == _truncate_body(invalid)
+
+    # No base64 source: not worth parsing, only truncated
+    no_images = json.dumps({'text': 'x' * MAX_LOGGED_BODY_CHARS})
+    body_json, fields = _capture_body(_message(no_images), {}, 'request')
+    assert body_json is None
+    assert fields['body'] == _truncate_body(no_images)
+
+
+def test_capture_body_parses_json_once_when_asked():
+    headers = {'content-type': 'application/json'}
+    body_json, fields = _capture_body(
+        _message('{"usage": {"input_tokens": 3}}'), headers, 'response', True
+    )
+    assert body_json == {'usage': {'input_tokens': 3}}
+    assert fields['body'] == '{"usage": {"input_tokens": 3}}'
+
+    body_json, _ = _capture_body(
+        _message('{"usage": 1}'), {'content-type': 'text/html'}, 'response', True
+    )
+    assert body_json is None
+
+
+def test_trim_base64_images_trims_nested_sources_in_place():
+    image = {'type': 'image', 'source': {'type': 'base64', 'data': 'AAAA'}}
+    url_image = {'type': 'image', 'source': {'type': 'url', 'url': 'http://x'}}
+    content = {
+        'messages': [
+            {'role': 'user', 'content': [{'type': 'text', 'text': 'hi'}, image]},
+            {'role': 'user', 'content': [{'tool_result': [image.copy()]}]},
+        ],
+        'other': url_image,
+    }
+
+    assert trim_base64_images(content) is content
+    assert image['source']['data'] == '...'
+    assert url_image['source']['url'] == 'http://x'
+    assert content['messages'][0]['content'][0] == {'type': 'text', 'text': 'hi'}
+
+
+class FakeJobLogService:
+    """Stands in for TenantAwareDatabaseService; the session is the tenant."""
+
+    def __init__(self, tenant_schema, db):
+        self.tenant_schema = tenant_schema
+        self.db = db
+
+    def create_job_logs(self, logs_data):
+        gate = self.db['gates'].get(self.tenant_schema)
+        if gate is not None:
+            gate.wait(timeout=5)
+        if self.tenant_schema in self.db['failing_tenants'] or any(
+            log['content'] in self.db['failing_contents'] for log in logs_data
+        ):
+            raise RuntimeError('insert failed')
+        self.db['rows'].setdefault(self.tenant_schema, []).extend(logs_data)
+
+    def create_job_log(self, log_data):
+        self.create_job_logs([log_data])
+
+
+@pytest.fixture
+def job_log_db(monkeypatch):
+    """Route the background writer to in-memory rows, keyed by tenant."""
+    db = {'rows': {}, 'failing_tenants': set(), 'failing_contents': set(), 'gates': {}}
+
+    @contextmanager
+    def fake_with_db(tenant_schema):
+        yield tenant_schema
+
+    monkeypatch.setattr(job_logging, 'with_db', fake_with_db)
+    monkeypatch.setattr(
+        job_logging,
+        'TenantAwareDatabaseService',
+        lambda tenant_schema: FakeJobLogService(tenant_schema, db),
+    )
+    # Each test runs its own event loop, so start from a fresh queue and writer
+    monkeypatch.setattr(job_logging, '_job_log_queue', None)
+    monkeypatch.setattr(job_logging, '_job_log_writer_task', None)
+    monkeypatch.setattr(job_logging, '_pending_job_logs', {})
+    return db
+
+
+def _contents(rows):
+    return [row['content'] for row in rows]
+
+
+def test_queued_job_logs_are_written_in_order_per_tenant(job_log_db):
+    async def run():
+        for i in range(100):
+            enqueue_job_log('job-a', 'system', f'a{i}', 'tenant_a')
+            enqueue_job_log('job-b', 'system', f'b{i}', 'tenant_b')
+        await flush_job_logs()
+
+    asyncio.run(run())
+
+    assert _contents(job_log_db['rows']['tenant_a']) == [f'a{i}' for i in range(100)]
+    assert _contents(job_log_db['rows']['tenant_b']) == [f'b{i}' for i in range(100)]
+
+
+def test_flush_job_logs_without_queued_logs_returns(job_log_db):
+    asyncio.run(flush_job_logs())
+
+
+def test_flush_job_logs_only_waits_for_that_job(job_log_db):
+    slow_tenant = job_log_db['gates']['tenant_slow'] = threading.Event()
+
+    async def run():
+        enqueue_job_log('job-a', 'system', 'a', 'tenant_a')
+        await flush_job_logs('job-a')
+
+        # The writer is now stuck on another job's tenant
+        enqueue_job_log('job-b', 'system', 'b', 'tenant_slow')
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(flush_job_logs('job-a'), timeout=1)
+        assert 'tenant_slow' not in job_log_db['rows']
+
+        slow_tenant.set()
+        await flush_job_logs('job-b')
+
+    asyncio.run(run())
+
+    assert _contents(job_log_db['rows']['tenant_a']) == ['a']
+    assert _contents(job_log_db['rows']['tenant_slow']) == ['b']
+    assert job_logging._pending_job_logs == {}
+
+
+def test_job_log_writer_is_restarted_after_it_stops(job_log_db):
+    async def run():
+        enqueue_job_log('job-a', 'system', 'first', 'tenant_a')
+        await flush_job_logs()
+
+        job_logging._job_log_writer_task.cancel()
+        await asyncio.gather(job_logging._job_log_writer_task, return_exceptions=True)
+
+        enqueue_job_log('job-a', 'system', 'second', 'tenant_a')
+        await flush_job_logs()
+
+    asyncio.run(run())
+
+    assert _contents(job_log_db['rows']['tenant_a']) == ['first', 'second']
+
+
+def test_failing_batch_only_loses_the_rows_that_fail(job_log_db):
+    job_log_db['failing_tenants'].add('tenant_broken')
+    job_log_db['failing_contents'].add('bad')
+
+    async def run():
+        enqueue_job_log('job-x', 'system', 'lost', 'tenant_broken')
+        enqueue_job_log('job-a', 'system', 'before', 'tenant_a')
+        enqueue_job_log('job-a', 'system', 'bad', 'tenant_a')
+        enqueue_job_log('job-a', 'system', 'after', 'tenant_a')
+        enqueue_job_log('job-b', 'system', 'other', 'tenant_b')
+        await flush_job_logs()
+
+    asyncio.run(run())
+
+    assert 'tenant_broken' not in job_log_db['rows']
+    assert _contents(job_log_db['rows']['tenant_a']) == ['before', 'after']
+    assert _contents(job_log_db['rows']['tenant_b']) == ['other']
+
+
+def test_full_job_log_queue_drops_new_entries(job_log_db, monkeypatch):
+    monkeypatch.setattr(job_logging, 'JOB_LOG_QUEUE_MAXSIZE', 2)
+
+    async def run():
+        # The writer only starts at the next await, so the queue fills up
+        for content in ('kept-1', 'kept-2', 'dropped'):
+            enqueue_job_log('job-a', 'system', content, 'tenant_a')
+        assert pending_job_log_count() == 2
+        await flush_job_logs('job-a')
+        assert pending_job_log_count() == 0
+
+    asyncio.run(run())
+
+    assert _contents(job_log_db['rows']['tenant_a']) == ['kept-1', 'kept-2']
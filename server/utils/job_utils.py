@@ -58,7 +58,7 @@ def compute_job_metrics(
         for exchange in http_exchanges:
             # Prefer to use content_trimmed for token counting if available
             # This should contain the token usage info without the heavy image data
-            content = exchange.get('content_trimmed', exchange.get('content', {}))
+            content = exchange.get('content_trimmed') or exchange.get('content') or {}
 
             # Check for token usage directly in the exchange (new format)
             if 'input_tokens' in content:
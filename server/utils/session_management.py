@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from typing import Any, Dict, Optional, Set  # Added Optional and Dict for type hints
 from uuid import UUID
@@ -15,8 +14,8 @@ from server.models.base import SessionCreate
 logger = logging.getLogger(__name__)
 
 # Global state copied from job_execution.py (potential issue)
+# Plain set operations never yield to the event loop, so no lock is needed
 targets_with_pending_sessions: Set[str] = set()
-targets_with_pending_sessions_lock = asyncio.Lock()
 
 
 async def launch_session_for_target(
@@ -76,9 +75,8 @@ async def launch_session_for_target(
         # Remove target from pending sessions set only if it was added
         # Note: The original code adds it *before* calling this function.
         # This function might need the lock/set passed in if we refactor later.
-        async with targets_with_pending_sessions_lock:
-            if target_id in targets_with_pending_sessions:
-                targets_with_pending_sessions.remove(target_id)
-                logger.info(
-                    f'Removed target {target_id} from pending sessions (in launch_session_for_target finally block)'
-                )
+        if target_id in targets_with_pending_sessions:
+            targets_with_pending_sessions.discard(target_id)
+            logger.info(
+                f'Removed target {target_id} from pending sessions (in launch_session_for_target finally block)'
+            )
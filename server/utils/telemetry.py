@@ -29,6 +29,13 @@ posthog = Posthog(
 )
 
 
+def is_tracking_enabled() -> bool:
+    """
+    Whether telemetry events are sent at all; callers can skip preparing them.
+    """
+    return not settings.VITE_PUBLIC_DISABLE_TRACKING
+
+
 def capture_event(request: Request | None, event_name: str, properties: dict):
     """
     Capture an event in Posthog.
@@ -38,7 +45,7 @@ def capture_event(request: Request | None, event_name: str, properties: dict):
         event_name: The name of the event
         properties: The properties of the event
     """
-    if settings.VITE_PUBLIC_DISABLE_TRACKING:
+    if not is_tracking_enabled():
         return
 
     try: